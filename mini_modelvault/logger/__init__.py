@@ -2,6 +2,6 @@
 Logger package for mini-modelvault.
 Provides logging setup utilities for the application.
 """
-from .logger import setup_logger
+from .logger import setup_logger, get_logger
 
-__all__ = ['setup_logger']
\ No newline at end of file
+__all__ = ['setup_logger', 'get_logger']
\ No newline at end of file
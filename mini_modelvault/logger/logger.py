@@ -7,6 +7,8 @@ Provides setup utilities for application-wide logging.
 from loguru import logger
 import os
 
+_ACTIVE = {"key": None}
+
 def setup_logger(log_dir: str, log_name: str = "app"):
     """
     Configure loguru logger with daily rotation and multiple log levels.
@@ -18,9 +20,29 @@ def setup_logger(log_dir: str, log_name: str = "app"):
     Returns:
         loguru.logger: Configured logger instance.
     """
+    key = (log_dir, log_name)
+    if _ACTIVE["key"] == key:  # already writing to this file; keep the existing sink
+        return logger
     os.makedirs(log_dir, exist_ok=True)
     log_path = os.path.join(log_dir, f"{log_name}.log")
-    logger.remove()  # Remove default handler
+    logger.remove()  # Remove default handler and any previously configured sink
+    # enqueue=True hands records to a background writer thread so callers never block on disk I/O.
+    # File sinks don't render ANSI colors, so the format carries no color markup.
     logger.add(log_path, rotation="1 day", retention="7 days", encoding="utf-8",
-               format="[<green>{time:DD-MM-YYYY HH:mm:ss}</green>] [<level>{level}</level>] <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <level>{message}</level>")
-    return logger
\ No newline at end of file
+               enqueue=True, backtrace=False, diagnose=False, catch=True, colorize=False,
+               format="[{time:DD-MM-YYYY HH:mm:ss}] [{level}] {name}:{function}:{line} | {message}")
+    _ACTIVE["key"] = key
+    return logger
+
+def get_logger(log_name: str = "app"):
+    """
+    Configure the logger for log_name in the LOG_DIR directory (default ./logs).
+    Repeated calls for the active sink return immediately (see setup_logger).
+
+    Args:
+        log_name (str): Log file name prefix.
+
+    Returns:
+        loguru.logger: Configured logger instance.
+    """
+    return setup_logger(os.getenv('LOG_DIR', './logs'), log_name)
@@ -6,16 +6,12 @@ It uses Typer for CLI management and Uvicorn for serving the HTTP API. The user
 Logging is set up at startup, and all major actions are logged for observability.
 """
 import typer
-import uvicorn
 import sys
 import os
+import functools
+import threading
 from typing import Optional
-from .logger import setup_logger
-import subprocess
-from rich.console import Console
-from .utils.model_check import check_and_pull_models
-
-console = Console()
+from .logger import get_logger
 
 app = typer.Typer(add_completion=False, help="""
 mini-modelvault: Run LLMs, vision, and more — all on your own hardware, with full privacy and control.
@@ -27,6 +23,7 @@ Available Modes:
     - If neither is provided, an interactive session is started.\n
     - In interactive session, to provide an image, use the format: <image>[image_path]<image>\n
   HTTP server: Start a FastAPI server exposing endpoints for inference and health checks.\n
+    - Use --dev to reload on code changes, or --workers/-w N to run N worker processes.\n
     - POST /generate: Run inference (text and/or image, with optional streaming).\n
       - To enable streaming output, use the query parameter: stream=true\n
     - GET /health: Get health status.\n
@@ -37,7 +34,18 @@ Use -h or --help with any command to see more details.\n
 
 run_app = typer.Typer(help="Run mini-modelvault in different modes.")
 
-logger = setup_logger(os.getenv('LOG_DIR', './logs'), 'main')
+HELP_FLAGS = ("-h", "--help")
+VERSION_FLAGS = ("-v", "--version")
+MODE_COMMANDS = ("cli", "http", "run")
+
+# uvloop (Cython event loop) and httptools (C HTTP parser); uvloop is unavailable on Windows
+UVICORN_OPTIONS = {
+    "loop": "asyncio" if sys.platform == "win32" else "uvloop",
+    "http": "httptools",
+    "ws": "none",
+}
+
+logger = get_logger('main')
 
 @app.callback(invoke_without_command=True)
 def main_callback(ctx: typer.Context, help: bool = typer.Option(False, '--help', '-h', is_eager=True, help='Show this message and exit.')):
@@ -45,27 +53,64 @@ def main_callback(ctx: typer.Context, help: bool = typer.Option(False, '--help',
         print_rich_help()
         raise typer.Exit()
 
+@functools.lru_cache(maxsize=None)
+def _console():
+    """
+    Lazily construct the shared Rich console (Rich is only imported when help is rendered).
+
+    Returns:
+        rich.console.Console: Console instance.
+    """
+    from rich.console import Console
+    return Console()
+
+BANNER = r"""
+  __  __  _         _          __  __             _        _ __      __            _  _   
+ |  \/  |(_)       (_)        |  \/  |           | |      | |\ \    / /           | || |  
+ | \  / | _  _ __   _  ______ | \  / |  ___    __| |  ___ | | \ \  / /__ _  _   _ | || |_ 
+ | |\/| || || '_ \ | ||______|| |\/| | / _ \  / _` | / _ \| |  \ \/ // _` || | | || || __|
+ | |  | || || | | || |        | |  | || (_) || (_| ||  __/| |   \  /| (_| || |_| || || |_ 
+ |_|  |_||_||_| |_||_|        |_|  |_| \___/  \__,_| \___||_|    \/  \__,_| \__,_||_| \__|
+
+"""
+
+HELP_MARKUP = (
+    "\n[bold magenta]" + "="*60 + "[/bold magenta]",
+    "[bold cyan]🌟 Welcome to mini-modelvault! 🌟[/bold cyan]",
+    "[bold magenta]" + "="*60 + "[/bold magenta]\n",
+    "[green]Run LLMs, vision, and more — all on your own hardware, with full privacy and control.[/green]\n",
+    "[yellow bold]Available Modes:[/yellow bold]",
+    "[green]  CLI: Run inference or start an interactive session from the command line.[/green]",
+    "[green]    - Use --text/-t to provide a text query.[/green]",
+    "[green]    - Use --image/-i to provide an image file for vision models.[/green]",
+    "[green]    - If neither is provided, an interactive session is started.[/green]",
+    "[green]    - In interactive session, to provide an image, use the format: <image>[image_path]<image>[/green]",
+    "[blue]  HTTP server: Start a FastAPI server exposing endpoints for inference and health checks.[/blue]",
+    "[blue]    - Use --dev to reload on code changes, or --workers/-w N to run N worker processes.[/blue]",
+    "[blue]    - POST /generate: Run inference (text and/or image, with optional streaming).[/blue]",
+    "[blue]      - To enable streaming output, use the query parameter: stream=true[/blue]",
+    "[blue]    - GET /health: Get health status.[/blue]",
+    "[blue]    - GET /status: Get device resource usage and health status.[/blue]\n",
+    "[cyan]Use -h or --help with any command to see more details.[/cyan]",
+    "[bold magenta]" + "="*60 + "[/bold magenta]\n",
+)
+
+@functools.lru_cache(maxsize=None)
+def _help_renderable():
+    """
+    Parse the help markup once and cache the resulting Rich renderable.
+
+    Returns:
+        rich.console.Group: Pre-parsed help text.
+    """
+    from rich.console import Group
+    from rich.text import Text
+    return Group(*(Text.from_markup(line) for line in HELP_MARKUP))
+
 def print_rich_help():
-    console.print("\n[bold magenta]" + "="*60 + "[/bold magenta]")
-    console.print("[bold cyan]🌟 Welcome to mini-modelvault! 🌟[/bold cyan]")
-    console.print("[bold magenta]" + "="*60 + "[/bold magenta]\n")
-    console.print("[green]Run LLMs, vision, and more — all on your own hardware, with full privacy and control.[/green]\n")
-    console.print("[yellow bold]Available Modes:[/yellow bold]")
-    console.print("[green]  CLI: Run inference or start an interactive session from the command line.[/green]")
-    console.print("[green]    - Use --text/-t to provide a text query.[/green]")
-    console.print("[green]    - Use --image/-i to provide an image file for vision models.[/green]")
-    console.print("[green]    - If neither is provided, an interactive session is started.[/green]")
-    console.print("[green]    - In interactive session, to provide an image, use the format: <image>[image_path]<image>[/green]")
-    console.print("[blue]  HTTP server: Start a FastAPI server exposing endpoints for inference and health checks.[/blue]")
-    console.print("[blue]    - POST /generate: Run inference (text and/or image, with optional streaming).[/blue]")
-    console.print("[blue]      - To enable streaming output, use the query parameter: stream=true[/blue]")
-    console.print("[blue]    - GET /health: Get health status.[/blue]")
-    console.print("[blue]    - GET /status: Get device resource usage and health status.[/blue]\n")
-    console.print("[cyan]Use -h or --help with any command to see more details.[/cyan]")
-    console.print("[bold magenta]" + "="*60 + "[/bold magenta]\n")
-
-@app.command()
-def cli(
+    _console().print(_help_renderable())
+
+def run_cli(
     input_text: Optional[str] = typer.Option(None, '--text', '-t', help="Text query to process"),
     input_image: Optional[str] = typer.Option(None, '--image', '-i', help="Path to the input image (optional)")
 ):
@@ -76,88 +121,91 @@ def cli(
         input_text (Optional[str]): Text query to process. If provided, will be passed to the CLI module.
         input_image (Optional[str]): Path to the input image. If provided, will be passed to the CLI module.
 
-    This function initializes the CLI mode, sets up arguments, and delegates execution to the CLI module.
+    This function initializes the CLI mode and calls the CLI module directly with the parsed options.
     """
     logger.info("CLI mode selected.")
     typer.echo("💬 Initializing CLI mode...")
     from mini_modelvault.services import cli as cli_module
-    sys.argv = [sys.argv[0]]
-    if input_text:
-        sys.argv.extend(['--text', input_text])
-    if input_image:
-        sys.argv.extend(['--image', input_image])
     try:
-        typer.run(cli_module.main)
+        cli_module.main(input_text=input_text, input_image=input_image)
     except Exception as e:
         logger.error(f"CLI execution failed: {e}")
         raise
 
-@app.command()
-def http():
+def run_http(
+    dev: bool = typer.Option(False, '--dev', help="Reload the server on code changes (development only)"),
+    workers: int = typer.Option(1, '--workers', '-w', help="Number of worker processes (ignored with --dev). Each worker loads "
+                                 "its own models, CPU sampler and GPU monitor, and logs to logs/server-<n>.log")
+):
     """
     Run HTTP server mode for mini-modelvault.
 
+    Parameters:
+        dev (bool): Enable auto-reload on code changes. Forces a single worker.
+        workers (int): Number of Uvicorn worker processes when not in dev mode.
+
     This function starts the HTTP server using Uvicorn, serving the FastAPI app defined in src/services/http_server.py.
-    The server listens on http://127.0.0.1:8000 and reloads on code changes.
+    The server listens on http://127.0.0.1:8000.
     """
-    logger.info("HTTP server mode selected.")
+    logger.info(f"HTTP server mode selected (dev={dev}, workers={1 if dev else workers}).")
     typer.echo("🚀 Starting HTTP server at http://127.0.0.1:8000 ...")
+    import uvicorn
+    workers = 1 if dev else max(1, workers)
+    # Worker processes inherit the environment; http_server reads this to give each its own log file
+    os.environ['HTTP_WORKERS'] = str(workers)
     try:
-        uvicorn.run("mini_modelvault.services.http_server:app", host="127.0.0.1", port=8000, reload=True)
+        uvicorn.run("mini_modelvault.services.http_server:app", host="127.0.0.1", port=8000,
+                    reload=dev, workers=workers, **UVICORN_OPTIONS)
     except Exception as e:
         logger.error(f"HTTP server failed to start: {e}")
         raise
 
-@run_app.command()
-def cli(
-    input_text: Optional[str] = typer.Option(None, '--text', '-t', help="Text query to process"),
-    input_image: Optional[str] = typer.Option(None, '--image', '-i', help="Path to the input image (optional)")
-):
-    """
-    Run CLI mode for mini-modelvault. (run subcommand)
-    """
-    logger.info("CLI mode selected (run subcommand).")
-    typer.echo("💬 Initializing CLI mode...")
-    from mini_modelvault.services import cli as cli_module
-    sys.argv = [sys.argv[0]]
-    if input_text:
-        sys.argv.extend(['--text', input_text])
-    if input_image:
-        sys.argv.extend(['--image', input_image])
-    try:
-        typer.run(cli_module.main)
-    except Exception as e:
-        logger.error(f"CLI execution failed: {e}")
-        raise
+# The same callables back both the top-level commands and the `run` subcommands
+for _typer_app in (app, run_app):
+    _typer_app.command("cli")(run_cli)
+    _typer_app.command("http")(run_http)
+
+app.add_typer(run_app, name="run")
 
-@run_app.command()
-def http():
+def get_version() -> str:
     """
-    Run HTTP server mode for mini-modelvault. (run subcommand)
+    Return the installed mini-modelvault version.
+
+    Returns:
+        str: Package version, or 'unknown' when running from an uninstalled checkout.
     """
-    logger.info("HTTP server mode selected (run subcommand).")
-    typer.echo("🚀 Starting HTTP server at http://127.0.0.1:8000 ...")
+    from importlib.metadata import version, PackageNotFoundError
     try:
-        uvicorn.run("mini_modelvault.services.http_server:app", host="127.0.0.1", port=8000, reload=True)
-    except Exception as e:
-        logger.error(f"HTTP server failed to start: {e}")
-        raise
-
-app.add_typer(run_app, name="run")
+        return version("mini-modelvault")
+    except PackageNotFoundError:
+        return "unknown"
 
 def main():
-    check_and_pull_models()
-    typer.echo(r"""
-  __  __  _         _          __  __             _        _ __      __            _  _   
- |  \/  |(_)       (_)        |  \/  |           | |      | |\ \    / /           | || |  
- | \  / | _  _ __   _  ______ | \  / |  ___    __| |  ___ | | \ \  / /__ _  _   _ | || |_ 
- | |\/| || || '_ \ | ||______|| |\/| | / _ \  / _` | / _ \| |  \ \/ // _` || | | || || __|
- | |  | || || | | || |        | |  | || (_) || (_| ||  __/| |   \  /| (_| || |_| || || |_ 
- |_|  |_||_||_| |_||_|        |_|  |_| \___/  \__,_| \___||_|    \/  \__,_| \__,_||_| \__|
-
-""")
+    args = sys.argv[1:]
+    # Fast path: pure help/version invocations skip the banner and model check entirely
+    if args and args[0] in HELP_FLAGS:
+        print_rich_help()
+        return
+    if args and args[0] in VERSION_FLAGS:
+        typer.echo(f"mini-modelvault {get_version()}")
+        return
+    typer.echo(BANNER)
+    from dotenv import load_dotenv
+    load_dotenv()  # MODEL_* overrides from .env must be visible to the model check and its marker key
+    from .utils.model_check import check_and_pull_models_cached, find_missing_models, pull_missing_models
+    # Only check models when a mode is going to run without help flags
+    if args and args[0] in MODE_COMMANDS and not any(a in HELP_FLAGS for a in args):
+        check_and_pull_models_cached()
     logger.info("mini-modelvault application started.")
     if len(sys.argv) == 1:
+        # Overlap the silent `ollama list` check with the time spent at the mode prompt.
+        # Anything that prints or pulls waits until a mode is chosen.
+        model_check_result = {}
+        model_check = threading.Thread(
+            target=lambda: model_check_result.update(missing=find_missing_models()),
+            name="model-check", daemon=True
+        )
+        model_check.start()
         typer.secho("Please select a mode to run mini-modelvault:", fg=typer.colors.CYAN, bold=True)
         typer.secho("  [1] CLI", fg=typer.colors.GREEN)
         typer.secho("  [2] HTTP server", fg=typer.colors.BLUE)
@@ -170,9 +218,13 @@ def main():
         choice = choice.strip()
         if choice == "1":
             logger.info("User selected CLI mode.")
+            model_check.join()
+            pull_missing_models(model_check_result.get("missing"))
             sys.argv.append("cli")
         elif choice == "2":
             logger.info("User selected HTTP server mode.")
+            model_check.join()
+            pull_missing_models(model_check_result.get("missing"))
             sys.argv.append("http")
         elif choice == "3":
             logger.info("User requested help.")
@@ -1,15 +1,100 @@
 """
-gpu_monitor.py – collects GPU info using `nvidia-smi`.
+gpu_monitor.py – collects GPU info using NVML (`nvidia-ml-py`) or, as a fallback, `nvidia-smi`.
 Provides a function to collect and log GPU utilization and memory usage.
 """
+import os
 import subprocess
 import platform
+import threading
+import time
 from typing import Optional
 from loguru import logger as default_logger
 
+try:
+    import pynvml  # optional: provided by the nvidia-ml-py package
+except ImportError:
+    pynvml = None
+
+GPU_INFO_TTL = 1.0  # seconds a GPU sample is reused before the GPU is queried again
+_CACHE = {"t": 0.0, "v": None}
+_NVML = {"ready": None}
+
+NVIDIA_SMI_QUERY = [
+    "nvidia-smi",
+    "--id=0",  # one line per sample, and the same GPU the NVML path reads
+    "--query-gpu=utilization.gpu,memory.total,memory.used",
+    "--format=csv,nounits,noheader"
+]
+_STREAM = {"proc": None, "failed": False, "latest": None}
+_STREAM_LOCK = threading.Lock()
+
+def _parse_smi_line(line: str) -> dict:
+    """
+    Parse one CSV line of nvidia-smi output.
+
+    Args:
+        line (str): Line in `util, mem_total, mem_used` form.
+
+    Returns:
+        dict: GPU info.
+    """
+    usage = line.strip().split(', ')
+    return {
+        'gpu_util': usage[0] + '%',
+        'mem_total': usage[1] + ' MiB',
+        'mem_used': usage[2] + ' MiB'
+    }
+
+def _read_smi_stream(proc):
+    """
+    Background reader storing the most recent sample from a looping nvidia-smi process.
+
+    Args:
+        proc: Running nvidia-smi Popen instance.
+    """
+    for line in proc.stdout:
+        try:
+            _STREAM["latest"] = _parse_smi_line(line)
+        except IndexError:
+            continue
+
+def _smi_stream_running() -> bool:
+    """
+    Start the looping nvidia-smi reader once per process.
+
+    Returns:
+        bool: True if the reader process is alive.
+    """
+    with _STREAM_LOCK:
+        if _STREAM["proc"] is None and not _STREAM["failed"]:
+            try:
+                proc = subprocess.Popen(NVIDIA_SMI_QUERY + ["-lms", "1000"], stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, text=True)
+            except OSError:
+                _STREAM["failed"] = True
+                return False
+            _STREAM["proc"] = proc
+            threading.Thread(target=_read_smi_stream, args=(proc,), name="nvidia-smi-reader", daemon=True).start()
+        return _STREAM["proc"] is not None and _STREAM["proc"].poll() is None
+
+def _nvml_ready() -> bool:
+    """
+    Initialize NVML once per process.
+
+    Returns:
+        bool: True if NVML calls can be used.
+    """
+    if _NVML["ready"] is None:
+        try:
+            pynvml.nvmlInit()
+            _NVML["ready"] = True
+        except Exception:
+            _NVML["ready"] = False
+    return _NVML["ready"]
+
 def get_gpu_info(logger: Optional[object] = None) -> dict:
     """
-    Collect GPU info using nvidia-smi. Logs actions and errors.
+    Collect GPU info, reusing the last sample for GPU_INFO_TTL seconds.
 
     Args:
         logger (Optional[object]): Optional loguru logger instance.
@@ -17,7 +102,24 @@ def get_gpu_info(logger: Optional[object] = None) -> dict:
     Returns:
         dict: Dictionary with GPU info or error.
     """
-    log = logger or default_logger
+    now = time.monotonic()
+    if _CACHE["v"] is not None and now - _CACHE["t"] < GPU_INFO_TTL:
+        return dict(_CACHE["v"])
+    info = _query_gpu_info(logger or default_logger)
+    _CACHE["t"], _CACHE["v"] = now, info
+    return dict(info)
+
+def _query_gpu_info(log) -> dict:
+    """
+    Query GPU utilization and memory usage via NVML, falling back to nvidia-smi.
+    Logs actions and errors.
+
+    Args:
+        log: Logger instance.
+
+    Returns:
+        dict: Dictionary with GPU info or error.
+    """
     os_type = platform.system()
     log.info(f"Detecting OS: {os_type}")
     if os_type == 'Darwin':  # macOS
@@ -26,19 +128,30 @@ def get_gpu_info(logger: Optional[object] = None) -> dict:
     if os_type not in ['Linux', 'Windows']:
         log.warning(f'Unsupported OS: {os_type}')
         return {'gpu': 'Unavailable', 'error': f'Unsupported OS: {os_type}'}
+    if pynvml is not None and _nvml_ready():
+        try:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+            mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            info = {
+                'gpu_util': f"{util.gpu}%",
+                'mem_total': f"{mem.total >> 20} MiB",
+                'mem_used': f"{mem.used >> 20} MiB"
+            }
+            log.info(f"GPU usage: {info}")
+            return info
+        except pynvml.NVMLError as e:
+            log.error(f'NVML error: {e}')
+            return {'gpu': 'Unavailable', 'error': str(e)}
+    # GPU_MONITOR_STREAM=1 keeps one `nvidia-smi -lms` process running instead of forking per query.
+    # Read per query rather than at import, so a value loaded from .env after this module is imported counts.
+    if os.getenv("GPU_MONITOR_STREAM", "0") == "1" and _smi_stream_running() and _STREAM["latest"] is not None:
+        return dict(_STREAM["latest"])
     try:
-        result = subprocess.check_output([
-            "nvidia-smi",
-            "--query-gpu=utilization.gpu,memory.total,memory.used",
-            "--format=csv,nounits,noheader"
-        ], stderr=subprocess.STDOUT)
-        usage = result.decode().strip().split(', ')
-        log.info(f"GPU usage: {usage}")
-        return {
-            'gpu_util': usage[0] + '%',
-            'mem_total': usage[1] + ' MiB',
-            'mem_used': usage[2] + ' MiB'
-        }
+        result = subprocess.check_output(NVIDIA_SMI_QUERY, stderr=subprocess.STDOUT)
+        info = _parse_smi_line(result.decode())
+        log.info(f"GPU usage: {info}")
+        return info
     except FileNotFoundError:
         log.error('nvidia-smi not found. Ensure NVIDIA drivers are installed and nvidia-smi is in your PATH.')
         return {'gpu': 'Unavailable', 'error': 'nvidia-smi not found. Ensure NVIDIA drivers are installed and nvidia-smi is in your PATH.'}
@@ -2,9 +2,13 @@
 health.py – Fault-tolerant health & status. Uses local check + fallback datastore.
 Provides the HealthChecker class for health and device status endpoints.
 """
+import threading
+import orjson
 import psutil
 from .gpu_monitor import get_gpu_info
 
+CPU_SAMPLE_INTERVAL = 1.0  # seconds per background CPU measurement
+
 
 class HealthChecker:
     """
@@ -21,6 +25,20 @@ class HealthChecker:
             logger: Logger instance.
         """
         self.logger = logger
+        # Prime psutil's CPU counters; the first non-blocking call always reports 0.0
+        self._cpu = psutil.cpu_percent(interval=None)
+        threading.Thread(target=self._sampler, name="cpu-sampler", daemon=True).start()
+
+    def _sampler(self):
+        """
+        Background loop that keeps the latest CPU utilization so requests never block on sampling.
+        """
+        while True:
+            try:
+                self._cpu = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL)
+            except Exception as e:
+                self.logger.error(f"CPU sampler failed: {e}")
+                return
 
     def status(self) -> dict:
         """
@@ -42,9 +60,9 @@ class HealthChecker:
         """
         try:
             ram = psutil.virtual_memory().percent
-            cpu = psutil.cpu_percent(interval=0.5)
+            cpu = self._cpu
             gpu = get_gpu_info(self.logger)
-            self.logger.info(f"Resource usage - RAM: {ram}%, CPU: {cpu}%, GPU: {gpu}")
+            self.logger.info("Resource usage: {}", orjson.dumps({'ram': ram, 'cpu': cpu, 'gpu': gpu}).decode())
         except Exception as e:
             self.logger.error(f"Failed to sample live: {e}")
             return {'health': 'DEGRADED', 'message': 'Resource usage unavailable'}
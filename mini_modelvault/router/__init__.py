@@ -2,6 +2,6 @@
 Router package for mini-modelvault.
 Provides model routing logic for inference requests.
 """
-from .router import ModelRouter
+from .router import ModelRouter, model_config
 
-__all__ = ['ModelRouter']
+__all__ = ['ModelRouter', 'model_config']
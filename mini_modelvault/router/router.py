@@ -3,15 +3,68 @@ router.py – Model routing logic for mini-modelvault.
 Implements the ModelRouter class using LangChain and ChatOllama models.
 Routes requests to general, coding, or vision models based on input.
 """
-from langchain_core.runnables import RunnableBranch
-from langchain_core.output_parsers import StrOutputParser
-from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage
 import base64
+import functools
+import mmap
+import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, Any
 
 
+def _sniff_image_mime(header: bytes) -> bytes:
+    """
+    Detect the image subtype from the file's magic bytes.
+
+    Args:
+        header (bytes): First bytes of the file.
+
+    Returns:
+        bytes: Image subtype for the data URL (defaults to b"png").
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return b"jpeg"
+    if header.startswith(b"GIF8"):
+        return b"gif"
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return b"webp"
+    return b"png"
+
+
+@functools.lru_cache(maxsize=8)
+def _encode_file_data_url(path: str, ino: int, mtime_ns: int, size: int) -> str:
+    """
+    Encode an image file as a base64 data URL, cached by path, inode, modification time and size.
+
+    Args:
+        path (str): Path to the file.
+        ino (int): File inode number (cache key only). Uploads replace files with os.replace,
+            which always creates a new inode even when the mtime does not visibly change.
+        mtime_ns (int): File modification time in nanoseconds (cache key only).
+        size (int): File size in bytes (cache key only).
+
+    Returns:
+        str: data:image/<type>;base64,<payload> URL.
+    """
+    if size == 0:
+        return "data:image/png;base64,"
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        prefix = b"data:image/" + _sniff_image_mime(m[:16]) + b";base64,"
+        return b"".join((prefix, base64.b64encode(m))).decode("ascii")
+
+
+def model_config() -> Dict[str, Any]:
+    """
+    Collect the MODEL_* settings from the environment for ModelRouter.
+    Call after load_dotenv() so .env overrides are included.
+
+    Returns:
+        Dict[str, Any]: MODEL_* environment variables.
+    """
+    return {k: v for k, v in os.environ.items() if k[:6] == 'MODEL_'}
+
 class ModelRouter:
     """
     LangChain v0.2+ ModelRouter using ChatOllama models.
@@ -22,6 +75,15 @@ class ModelRouter:
         logger: Logger instance for logging actions and errors.
     """
 
+    _CLASS_RE = re.compile(r'\b(general|coding|vision)\b', re.IGNORECASE)
+    # Unambiguous coding markers that let us skip the classifier model round-trip.
+    # Anything less certain goes to the (cached) classifier.
+    _CODE_HINT_RE = re.compile(
+        r'```|^\s*(?:def\s+\w+\s*\(|class\s+\w+\s*[:(]|#include\s*<)',
+        re.MULTILINE
+    )
+    _CLASSIFY_CACHE_SIZE = 256
+
     def __init__(self, config: Dict[str, Any], logger):
         """
         Initialize the ModelRouter with configuration and logger.
@@ -31,11 +93,13 @@ class ModelRouter:
             logger: Logger instance.
         """
         self.logger = logger
+        self._classify_cache = OrderedDict()
+        self._classify_lock = threading.Lock()  # route/stream_route run on server threadpool threads
         self._load_models(config)
 
     def _load_models(self, cfg: Dict[str, Any]):
         """
-        Instantiate ChatOllama models and build routing logic.
+        Resolve model names from configuration. Models are instantiated lazily on first use.
 
         Args:
             cfg (Dict[str, Any]): Model configuration.
@@ -47,32 +111,55 @@ class ModelRouter:
             "MODEL_VISION": "llava-phi3"
         }
         # Use config value if present, else fallback to default
-        general_model = cfg.get("MODEL_GENERAL", DEFAULTS["MODEL_GENERAL"])
-        coding_model = cfg.get("MODEL_CODING", DEFAULTS["MODEL_CODING"])
-        vision_model = cfg.get("MODEL_VISION", DEFAULTS["MODEL_VISION"])
+        self._general_name = cfg.get("MODEL_GENERAL", DEFAULTS["MODEL_GENERAL"])
+        self._coding_name = cfg.get("MODEL_CODING", DEFAULTS["MODEL_CODING"])
+        self._vision_name = cfg.get("MODEL_VISION", DEFAULTS["MODEL_VISION"])
+        self.logger.info(f"Models configured: general={self._general_name}, coding={self._coding_name}, vision={self._vision_name}.")
+
+    def _chat_model(self, model_name: str):
+        """
+        Instantiate a ChatOllama model.
+
+        Args:
+            model_name (str): Ollama model name.
+
+        Returns:
+            ChatOllama: Model instance.
+        """
+        # Imported here so the package can be loaded without pulling in langchain_ollama
+        from langchain_ollama import ChatOllama
         try:
-            self.general = ChatOllama(model=general_model)
-            self.coding = ChatOllama(model=coding_model)
-            self.vision = ChatOllama(model=vision_model)
-            self.logger.info(f"Models loaded: general={general_model}, coding={coding_model}, vision={vision_model}.")
+            model = ChatOllama(model=model_name)
+            self.logger.info(f"Model loaded: {model_name}.")
+            return model
         except Exception as e:
-            self.logger.error(f"Failed to load models: {e}")
+            self.logger.error(f"Failed to load model {model_name}: {e}")
             raise
-        self.output_parser = StrOutputParser()
-        self.router_model = ChatOllama(model=general_model)
-        self.router_chain = (
-            self.router_model
-            | self.output_parser
-        )
-        self.router_branch = RunnableBranch(
-            (lambda x: "image_path" in x and x["image_path"] is not None, self._vision_invoke),
-            (lambda x: self._classify(x["input"]) == "coding", self._coding_invoke),
-            self._general_invoke
-        )
+
+    @functools.cached_property
+    def general(self):
+        """General-purpose chat model."""
+        return self._chat_model(self._general_name)
+
+    @functools.cached_property
+    def coding(self):
+        """Coding model."""
+        return self._chat_model(self._coding_name)
+
+    @functools.cached_property
+    def vision(self):
+        """Vision (multimodal) model."""
+        return self._chat_model(self._vision_name)
+
+    @functools.cached_property
+    def router_model(self):
+        """Model used to classify inputs."""
+        return self._chat_model(self._general_name)
 
     def _classify(self, input_text: str) -> str:
         """
         Classify input text as 'general', 'coding', or 'vision' using the router model.
+        Obvious code input is detected heuristically and model labels are cached per input text.
 
         Args:
             input_text (str): The input text to classify.
@@ -80,35 +167,77 @@ class ModelRouter:
         Returns:
             str: The classification label.
         """
-        self.logger.debug(f"Classifying input: {input_text}")
-        result = self.router_chain.invoke([HumanMessage(content=f"Classify the following input into one of: general, coding, vision:\n{input_text}")])
-        match = re.search(r'\b(general|coding|vision)\b', result.lower())
+        self.logger.opt(lazy=True).debug("Classifying input: {}", lambda: input_text)
+        with self._classify_lock:
+            cached = self._classify_cache.get(input_text)
+            if cached is not None:
+                self._classify_cache.move_to_end(input_text)
+        if cached is not None:
+            self.logger.info(f"Input classified as: {cached} (cached)")
+            return cached
+        if self._CODE_HINT_RE.search(input_text):
+            self.logger.info("Input classified as: coding (heuristic)")
+            return "coding"
+        result = self.router_model.invoke([HumanMessage(content=f"Classify the following input into one of: general, coding, vision:\n{input_text}")]).content
+        match = self._CLASS_RE.search(result)
         if match:
-            label = match.group(1)
+            label = match.group(1).lower()
             self.logger.info(f"Input classified as: {label}")
+            with self._classify_lock:
+                self._classify_cache[input_text] = label
+                if len(self._classify_cache) > self._CLASSIFY_CACHE_SIZE:
+                    self._classify_cache.popitem(last=False)
             return label
         self.logger.warning(f"Classifier returned unexpected result: {result}")
         return result.strip().lower()
 
-    def encode_image_to_base64(self, image_path: str) -> str:
+    def encode_image_to_data_url(self, image_path: str) -> str:
         """
-        Encode an image file to a base64 string.
+        Encode an image file to a base64 data URL with its detected MIME type.
 
         Args:
             image_path (str): Path to the image file.
 
         Returns:
-            str: Base64-encoded image string.
+            str: Data URL for the image.
         """
         try:
-            with open(image_path, "rb") as f:
-                encoded = base64.b64encode(f.read()).decode("utf-8")
+            st = os.stat(image_path)
+            data_url = _encode_file_data_url(image_path, st.st_ino, st.st_mtime_ns, st.st_size)
             self.logger.debug(f"Encoded image {image_path} to base64.")
-            return encoded
+            return data_url
         except Exception as e:
             self.logger.error(f"Failed to encode image {image_path}: {e}")
             raise
 
+    def encode_image_to_base64(self, image_path: str) -> str:
+        """
+        Encode an image file to a base64 string.
+
+        Args:
+            image_path (str): Path to the image file.
+
+        Returns:
+            str: Base64-encoded image string.
+        """
+        return self.encode_image_to_data_url(image_path).partition(",")[2]
+
+    def _vision_message(self, text: str, image_path: str) -> HumanMessage:
+        """
+        Build a multimodal message carrying the text prompt and the encoded image.
+
+        Args:
+            text (str): Input text.
+            image_path (str): Path to the input image.
+
+        Returns:
+            HumanMessage: Message for the vision model.
+        """
+        return HumanMessage(content=[
+            {"type": "text", "text": text},
+            {"type": "image_url", "image_url": {"url": self.encode_image_to_data_url(image_path)}}
+        ])
+
     def _vision_invoke(self, x: dict) -> str:
         """
         Invoke the vision model for image-based input.
@@ -120,14 +249,8 @@ class ModelRouter:
             str: Model response.
         """
         self.logger.info("Routing to vision model.")
-        image_base64 = self.encode_image_to_base64(x["image_path"])
-        image_url = f"data:image/png;base64,{image_base64}"
-        message = HumanMessage(content=[
-            {"type": "text", "text": x["input"]},
-            {"type": "image_url", "image_url": {"url": image_url}}
-        ])
-        result = self.vision.invoke([message])
-        self.logger.debug(f"Vision model result: {result}")
+        result = self.vision.invoke([self._vision_message(x["input"], x["image_path"])])
+        self.logger.opt(lazy=True).debug("Vision model result: {}", lambda: result)
         return result
 
     def _general_invoke(self, x: dict) -> str:
@@ -143,7 +266,7 @@ class ModelRouter:
         self.logger.info("Routing to general model.")
         message = HumanMessage(content=x["input"])
         result = self.general.invoke([message])
-        self.logger.debug(f"General model result: {result}")
+        self.logger.opt(lazy=True).debug("General model result: {}", lambda: result)
         return result
 
     def _coding_invoke(self, x: dict) -> str:
@@ -159,7 +282,7 @@ class ModelRouter:
         self.logger.info("Routing to coding model.")
         message = HumanMessage(content=x["input"])
         result = self.coding.invoke([message])
-        self.logger.debug(f"Coding model result: {result}")
+        self.logger.opt(lazy=True).debug("Coding model result: {}", lambda: result)
         return result
 
     def route(self, text: str, image_path: str = None):
@@ -179,13 +302,7 @@ class ModelRouter:
             payload["image_path"] = image_path
             self.logger.info(f"Image input detected: {image_path}")
             try:
-                image_base64 = self.encode_image_to_base64(image_path)
-                image_url = f"data:image/png;base64,{image_base64}"
-                message = HumanMessage(content=[
-                    {"type": "text", "text": text},
-                    {"type": "image_url", "image_url": {"url": image_url}}
-                ])
-                result = self.vision.invoke([message])
+                result = self._vision_invoke(payload)
                 self.logger.info("Vision model invoked successfully.")
                 return ("vision", result)
             except Exception as e:
@@ -194,14 +311,10 @@ class ModelRouter:
         else:
             self.logger.info(f"Text input: {text}")
             try:
-                message = HumanMessage(content=text)
                 if self._classify(text) == "coding":
-                    model = self.coding
-                    model_type = "coding"
+                    model_type, result = "coding", self._coding_invoke(payload)
                 else:
-                    model = self.general
-                    model_type = "general"
-                result = model.invoke([message])
+                    model_type, result = "general", self._general_invoke(payload)
                 self.logger.info(f"Model '{model_type}' invoked successfully.")
                 return (model_type, result)
             except Exception as e:
@@ -224,13 +337,7 @@ class ModelRouter:
             payload["image_path"] = image_path
             self.logger.info(f"Image input detected: {image_path}")
             try:
-                image_base64 = self.encode_image_to_base64(image_path)
-                image_url = f"data:image/png;base64,{image_base64}"
-                message = HumanMessage(content=[
-                    {"type": "text", "text": text},
-                    {"type": "image_url", "image_url": {"url": image_url}}
-                ])
-                stream = self.vision.stream([message])
+                stream = self.vision.stream([self._vision_message(text, image_path)])
                 self.logger.info("Vision model streaming started.")
                 model_type = "vision"
             except Exception as e:
@@ -252,7 +359,18 @@ class ModelRouter:
                 self.logger.error(f"Text model streaming failed: {e}")
                 raise
         def stream_with_type():
-            for chunk in stream:
-                self.logger.debug(f"Stream chunk: {chunk}")
-                yield chunk.content if hasattr(chunk, "content") else chunk
+            # Per-chunk logging is left to InferenceService, which also emits the full-response summary
+            it = iter(stream)
+            try:
+                first = next(it)
+            except StopIteration:
+                return
+            # Chunks from a given model share one type, so probe for .content only once
+            if hasattr(first, "content"):
+                yield first.content
+                for chunk in it:
+                    yield chunk.content
+            else:
+                yield first
+                yield from it
         return (model_type, stream_with_type())
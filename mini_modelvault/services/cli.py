@@ -4,8 +4,8 @@ Provides the CLI entry point for running inference and interactive sessions in m
 Handles text and image input, logging, and error management.
 """
 import typer
-from mini_modelvault.router.router import ModelRouter
-from mini_modelvault.logger import setup_logger
+from mini_modelvault.router.router import ModelRouter, model_config
+from mini_modelvault.logger import get_logger
 import os
 from dotenv import load_dotenv
 from mini_modelvault.utils import SpinnerHandler
@@ -17,7 +17,7 @@ from mini_modelvault.utils.image_handler import handle_image
 
 load_dotenv()
 
-logger = setup_logger(os.getenv('LOG_DIR', './logs'), 'cli')
+logger = get_logger('cli')
 
 
 def main(
@@ -35,21 +35,22 @@ def main(
     and either runs a one-off inference or starts an interactive session.
     Logs all actions and errors.
     """
-    cfg = {k: v for k, v in os.environ.items() if k.startswith('MODEL_')}
-    router = ModelRouter(cfg, logger)
-    service = InferenceService(router, logger)
+    router = ModelRouter(model_config(), logger)
+    service = InferenceService(router, logger, log_responses=os.getenv('LOG_RESPONSES', '1') != '0')
 
     logger.info("CLI started.")
     input_text, input_image = handle_image(input_text, input_image, logger)
 
     if input_text or input_image:
         with SpinnerHandler(logger=logger) as spinner:
+            debug = logger.opt(lazy=True).debug
             try:
                 for chunk in service.run_stream(input_text or '', image_path=input_image):
-                    logger.debug(f"Streaming chunk: {chunk}")
+                    debug("Streaming chunk: {}", lambda: chunk)
                     spinner.write_chunk(chunk)
             except Exception as e:
                 logger.error(f"Error during inference: {e}")
+                spinner.flush()
                 print(f"\n💥 Error: {e}")
         print()
         return
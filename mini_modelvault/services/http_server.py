@@ -5,23 +5,162 @@ Handles file uploads, streaming, and logging.
 """
 from fastapi import FastAPI, UploadFile, File, Form, Query
 from mini_modelvault.observability.health import HealthChecker
-from mini_modelvault.router.router import ModelRouter
-from mini_modelvault.logger import setup_logger
+from mini_modelvault.router.router import ModelRouter, model_config
+from mini_modelvault.logger import get_logger
+import asyncio
+import itertools
 import os
+import shutil
+import tempfile
+import threading
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from mini_modelvault.services.inference_service import InferenceService
+from mini_modelvault.utils.image_handler import ASSETS_DIR
+
+_WORKER_SLOT = {"lock": None}
+
+def _server_log_name() -> str:
+    """
+    Pick the log file name for this server process.
+    Loguru's rotating file sink is not safe to share between processes, so with --workers N
+    each worker claims the lowest free slot n by locking LOG_DIR/.server-<n>.lock for its
+    lifetime and logs to server-<n>.log. Restarts reuse the same names, so the sink's
+    retention keeps cleaning them up.
+
+    Returns:
+        str: Log name for get_logger.
+    """
+    if int(os.getenv('HTTP_WORKERS', '1')) <= 1:
+        return 'server'
+    log_dir = os.getenv('LOG_DIR', './logs')
+    os.makedirs(log_dir, exist_ok=True)
+    for slot in itertools.count(1):
+        f = open(os.path.join(log_dir, f'.server-{slot}.lock'), 'a')
+        try:
+            if os.name == 'nt':
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            continue
+        _WORKER_SLOT["lock"] = f  # held open; the OS releases the lock when the worker exits
+        return f'server-{slot}'
 
-app = FastAPI()
-logger = setup_logger(os.getenv('LOG_DIR', './logs'), 'server')
-cfg = {k: v for k, v in os.environ.items() if k.startswith('MODEL_')}
-router = ModelRouter(cfg, logger)
-service = InferenceService(router, logger)
+app = FastAPI(default_response_class=ORJSONResponse)
+logger = get_logger(_server_log_name())
+router = ModelRouter(model_config(), logger)
+service = InferenceService(router, logger, log_responses=os.getenv('LOG_RESPONSES', '1') != '0')
 health = HealthChecker(logger)
 
+STREAM_FLUSH_BYTES = 4096  # send a streamed batch once it reaches this size
+STREAM_FLUSH_INTERVAL = 0.025  # or once this many seconds passed since the batch started
+
+def _produce_chunks(iterator, loop, state, stop):
+    """
+    Drain a blocking stream in a worker thread into the shared buffer in state.
+    The event loop is only woken when the buffer stops being empty, when it reaches
+    STREAM_FLUSH_BYTES, and when the stream ends, so chunks are handed over in groups.
+
+    Args:
+        iterator: Iterator over streamed chunks.
+        loop: Event loop that owns state['wake'].
+        state (dict): Shared 'lock', 'buf', 'wake' (asyncio.Event), 'done' and 'error'.
+        stop (threading.Event): Set when the client went away; stops pulling from the stream.
+    """
+    debug = logger.opt(lazy=True).debug
+    lock, buf, wake = state['lock'], state['buf'], state['wake']
+    try:
+        for chunk in iterator:
+            if stop.is_set():
+                return
+            debug("Streaming chunk: {}", lambda: chunk)
+            data = chunk.encode() if isinstance(chunk, str) else str(chunk).encode()
+            with lock:
+                size = len(buf)
+                buf += data
+            if size == 0 or size < STREAM_FLUSH_BYTES <= size + len(data):
+                loop.call_soon_threadsafe(wake.set)
+    except Exception as e:
+        state['error'] = e
+    state['done'] = True
+    if not stop.is_set():
+        loop.call_soon_threadsafe(wake.set)
+
+async def _batched_stream(iterator):
+    """
+    Coalesce chunks from a blocking stream into batches of encoded bytes.
+    A batch is sent once it reaches STREAM_FLUSH_BYTES or once STREAM_FLUSH_INTERVAL has
+    passed since its first chunk, whether or not another chunk has arrived by then.
+
+    Args:
+        iterator: Iterator over streamed chunks.
+
+    Yields:
+        bytes: Encoded batch.
+    """
+    loop = asyncio.get_running_loop()
+    wake = asyncio.Event()
+    state = {'lock': threading.Lock(), 'buf': bytearray(), 'wake': wake, 'done': False, 'error': None}
+    stop = threading.Event()
+    # The default executor is the same bounded pool asyncio.to_thread uses for service.run
+    loop.run_in_executor(None, _produce_chunks, iterator, loop, state, stop)
+    try:
+        while True:
+            await wake.wait()
+            wake.clear()
+            deadline = loop.time() + STREAM_FLUSH_INTERVAL
+            while not state['done'] and len(state['buf']) < STREAM_FLUSH_BYTES:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(wake.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                wake.clear()
+            done = state['done']  # read before taking the buffer so no final chunk is left behind
+            with state['lock']:
+                batch = bytes(state['buf'])
+                state['buf'].clear()
+            if batch:
+                yield batch
+            if done:
+                break
+        if state['error'] is not None:
+            raise state['error']
+    finally:
+        stop.set()
+
+def _save_upload(src, dst: str):
+    """
+    Copy an uploaded file to disk in 1 MiB blocks.
+    The data goes to a temporary file that then replaces dst, so an existing dst that is
+    a hardlink to a user's image (see handle_image) is never written through.
+
+    Args:
+        src: File-like object holding the upload.
+        dst (str): Destination path.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst) or '.', prefix='.upload-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            shutil.copyfileobj(src, f, length=1 << 20)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates files as 0600
+        os.replace(tmp_path, dst)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def log_request_info(endpoint, **kwargs):
     """
     Log information about an incoming API request.
@@ -30,7 +169,8 @@ def log_request_info(endpoint, **kwargs):
         endpoint (str): The endpoint being called.
         **kwargs: Additional request parameters.
     """
-    logger.info(f"Endpoint '{endpoint}' called with args: {kwargs}")
+    # Positional args let loguru skip formatting entirely when INFO is filtered out
+    logger.info("Endpoint '{}' called with args: {}", endpoint, kwargs)
 
 @app.post('/generate')
 async def generate(
@@ -49,32 +189,31 @@ async def generate(
     Returns:
         StreamingResponse or dict: Streaming output or result/error message.
     """
-    log_request_info('/generate', text=text, file=file.filename if file else None, stream=stream)
+    filename = file.filename if file is not None else None
+    log_request_info('/generate', text=text, file=filename, stream=stream)
     path = None
     # Error handling for missing or empty file
-    if file is not None and (not file.filename or file.filename.strip() == ""):
+    if file is not None and (not filename or not filename.strip()):
         logger.error("Image is required but not provided.")
         return {"error": "Image is required."}
     if file:
-        os.makedirs('assets', exist_ok=True)
-        path = os.path.join('assets', file.filename)
+        path = os.path.join(ASSETS_DIR, filename)
         try:
-            with open(path, 'wb') as f:
-                f.write(await file.read())
+            await asyncio.to_thread(_save_upload, file.file, path)
             logger.info(f"Saved uploaded file to {path}")
         except Exception as e:
             logger.error(f"Failed to save uploaded file: {e}")
             return {"error": str(e)}
     try:
         if stream:
-            def stream_fn():
-                for chunk in service.run_stream(text or '', image_path=path):
-                    logger.debug(f"Streaming chunk: {chunk}")
-                    yield str(chunk)
+            # The blocking model stream is drained by a producer thread; batches are flushed
+            # on size or on the interval deadline, so StreamingResponse sends far fewer messages
+            iterator = iter(service.run_stream(text or '', image_path=path))
             logger.info("Streaming response initiated.")
-            return StreamingResponse(stream_fn(), media_type="text/event-stream")
+            return StreamingResponse(_batched_stream(iterator), media_type="text/event-stream")
         else:
-            result = service.run(text or '', image_path=path)
+            # Inference blocks; run it in a worker thread so the event loop keeps serving other requests
+            result = await asyncio.to_thread(service.run, text or '', image_path=path)
             logger.info("Non-streaming response returned.")
             return {"result": result}
     except Exception as e:
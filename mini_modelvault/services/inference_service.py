@@ -3,7 +3,7 @@ inference_service.py – Service for running inference using a model router.
 Handles both streaming and non-streaming inference, logging all actions and errors.
 """
 
-import json
+import orjson
 
 class InferenceService:
     """
@@ -12,17 +12,21 @@ class InferenceService:
     Args:
         router: ModelRouter instance for routing inference requests.
         logger: Logger instance for logging actions and errors.
+        log_responses (bool): Whether to log each full response as a JSON record.
     """
-    def __init__(self, router, logger):
+    def __init__(self, router, logger, log_responses: bool = True):
         """
         Initialize the InferenceService.
 
         Args:
             router: ModelRouter instance.
             logger: Logger instance.
+            log_responses (bool): Whether to log each full response. When False, streamed
+                chunks are not accumulated at all.
         """
         self.router = router
         self.logger = logger
+        self.log_responses = log_responses
 
     def run_stream(self, text: str, image_path: str = None):
         """
@@ -38,20 +42,24 @@ class InferenceService:
         self.logger.info(f"Running stream inference. Text: {text}, Image: {image_path}")
         try:
             model_type, stream = self.router.stream_route(text, image_path=image_path)
+            accumulate = self.log_responses
             chunks = []
+            # Bind per-chunk callables once instead of looking them up on every token
+            debug = self.logger.opt(lazy=True).debug
             for chunk in stream:
-                self.logger.debug(f"Streamed chunk: {chunk}")
-                chunks.append(chunk)
+                debug("Streamed chunk: {}", lambda: chunk)
+                if accumulate:
+                    chunks.append(chunk if isinstance(chunk, str) else str(chunk))
                 yield chunk
             # Log the full response after streaming is complete
-            full_response = ''.join(str(c) for c in chunks)
-            log_obj = {
-                "model_type": model_type,
-                "input_text": text,
-                "image_path": image_path,
-                "response": full_response
-            }
-            self.logger.info(json.dumps(log_obj, ensure_ascii=False))
+            if accumulate:
+                log_obj = {
+                    "model_type": model_type,
+                    "input_text": text,
+                    "image_path": image_path,
+                    "response": ''.join(chunks)
+                }
+                self.logger.info(orjson.dumps(log_obj, default=str).decode())
         except Exception as e:
             self.logger.error(f"Stream inference failed: {e}")
             raise
@@ -70,13 +78,14 @@ class InferenceService:
         self.logger.info(f"Running inference. Text: {text}, Image: {image_path}")
         try:
             model_type, result = self.router.route(text, image_path=image_path)
-            log_obj = {
-                "model_type": model_type,
-                "input_text": text,
-                "image_path": image_path,
-                "response": result
-            }
-            self.logger.info(json.dumps(log_obj, ensure_ascii=False))
+            if self.log_responses:
+                log_obj = {
+                    "model_type": model_type,
+                    "input_text": text,
+                    "image_path": image_path,
+                    "response": result
+                }
+                self.logger.info(orjson.dumps(log_obj, default=str).decode())
             self.logger.info("Inference completed successfully.")
             return result
         except Exception as e:
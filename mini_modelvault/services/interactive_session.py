@@ -5,12 +5,14 @@ Provides a loop for user interaction, streaming inference, and error handling.
 # src/cli/interactive_session.py
 from mini_modelvault.utils.spinner_handler import SpinnerHandler
 from mini_modelvault.utils.image_handler import handle_image
-from typer import prompt, echo
 from loguru import logger
 import os
+import sys
 import re
 import shutil
 
+_EXIT_CMDS = frozenset({'/bye', 'exit', 'quit'})
+
 def run_interactive(service, logger=logger):
     """
     Run an interactive CLI session with detailed logging and image tag handling.
@@ -23,30 +25,36 @@ def run_interactive(service, logger=logger):
     Handles image tags in user input and streams inference results.
     Logs all actions and errors.
     """
-    echo("👋 Welcome to Mini-ModelVault CLI! Type '/bye' to exit.\n")
+    sys.stdout.write("👋 Welcome to Mini-ModelVault CLI! Type '/bye' to exit.\n\n")
     logger.info("Interactive session started.")
     try:
         while True:
             try:
-                user_input = prompt("\n\nYou")
+                user_input = input("\n\nYou: ")
                 logger.debug(f"User input: {user_input}")
-                if user_input.strip().lower() in ('/bye', 'exit', 'quit'):
-                    echo("👋 Goodbye!")
+                if not user_input.strip():
+                    continue
+                if user_input.strip().lower() in _EXIT_CMDS:
+                    sys.stdout.write("👋 Goodbye!\n")
                     logger.info("User exited interactive session.")
                     break
                 # Handle <image> tag in user input
                 input_text, input_image = handle_image(user_input, None, logger)
                 with SpinnerHandler(logger=logger) as spinner:
+                    debug, write_chunk = logger.opt(lazy=True).debug, spinner.write_chunk
                     try:
                         for chunk in service.run_stream(input_text or '', image_path=input_image):
-                            logger.debug(f"Streamed chunk: {chunk}")
-                            spinner.write_chunk(chunk)
+                            debug("Streamed chunk: {}", lambda: chunk)
+                            write_chunk(chunk)
                     except Exception as e:
                         logger.error(f"Error during streaming in interactive session: {e}", exc_info=True)
+                        spinner.flush()
                         print(f"\n💥 Error: {e}")
+            except EOFError:
+                raise
             except Exception as e:
                 logger.error(f"Error in interactive session loop: {e}", exc_info=True)
                 print(f"\n💥 Error: {e}")
     except (EOFError, KeyboardInterrupt):
-        echo("\n👋 Session ended by user.")
+        sys.stdout.write("\n👋 Session ended by user.\n")
         logger.info("Interactive session ended by user.")
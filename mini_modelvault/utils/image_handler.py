@@ -8,6 +8,44 @@ import shutil
 from loguru import logger as default_logger
 from typing import Optional, Tuple
 
+_IMAGE_TAG_RE = re.compile(r"<image>(.*?)<image>")
+
+ASSETS_DIR = 'assets'
+os.makedirs(ASSETS_DIR, exist_ok=True)  # created once at import rather than on every call
+
+def _same_file(src: str, dst: str) -> bool:
+    """
+    Check whether two paths refer to the same file (symlinks and hardlinks included).
+
+    Args:
+        src (str): Existing file path.
+        dst (str): Path that may not exist yet.
+
+    Returns:
+        bool: True if both paths point to the same file.
+    """
+    try:
+        return os.path.samefile(src, dst)
+    except OSError:
+        return False
+
+def _link_or_copy(src: str, dst: str):
+    """
+    Hardlink src to dst, falling back to a byte copy (e.g. across filesystems).
+
+    Args:
+        src (str): Source file path.
+        dst (str): Destination file path.
+    """
+    # Replace dst's directory entry instead of writing into it: an existing dst may be
+    # a hardlink to another user's file, which an in-place copy would overwrite
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copy(src, dst)
+
 def handle_image(input_text: Optional[str], input_image: Optional[str], logger=default_logger) -> Tuple[Optional[str], Optional[str]]:
     """
     Extract image from <image> tag in text or from input_image, copy to assets, and return updated text and image path.
@@ -21,22 +59,21 @@ def handle_image(input_text: Optional[str], input_image: Optional[str], logger=d
         Tuple[Optional[str], Optional[str]]: (updated_text, image_path or None)
     """
     if not input_image and input_text:
-        image_tag = re.search(r"<image>(.*?)<image>", input_text)
+        image_tag = _IMAGE_TAG_RE.search(input_text)
         logger.debug(f"Image tag found: {image_tag}")
         if image_tag:
             image_path = image_tag.group(1).strip()
             if os.path.isfile(image_path):
-                os.makedirs('assets', exist_ok=True)
                 filename = os.path.basename(image_path)
-                dest_path = os.path.join('assets', filename)
+                dest_path = os.path.join(ASSETS_DIR, filename)
                 # Skip copying if source and destination are the same file
-                if os.path.abspath(image_path) != os.path.abspath(dest_path):
-                    shutil.copy(image_path, dest_path)
-                    logger.info(f"Copied image from {image_path} to {dest_path}")
+                if not _same_file(image_path, dest_path):
+                    _link_or_copy(image_path, dest_path)
+                    logger.info(f"Linked or copied image from {image_path} to {dest_path}")
                 else:
                     logger.info(f"Skipped copying: '{image_path}' and '{dest_path}' are the same file.")
                 input_image = dest_path
-                input_text = re.sub(r"<image>.*?<image>", "", input_text).strip()
+                input_text = _IMAGE_TAG_RE.sub("", input_text).strip()
             else:
                 logger.error(f"Image file '{image_path}' not found.")
                 print(f"\n💥 Error: Image file '{image_path}' not found.")
@@ -44,13 +81,12 @@ def handle_image(input_text: Optional[str], input_image: Optional[str], logger=d
     elif input_image:
         image_path = input_image.strip()
         if os.path.isfile(image_path):
-            os.makedirs('assets', exist_ok=True)
             filename = os.path.basename(image_path)
-            dest_path = os.path.join('assets', filename)
+            dest_path = os.path.join(ASSETS_DIR, filename)
             # Skip copying if source and destination are the same file
-            if os.path.abspath(image_path) != os.path.abspath(dest_path):
-                shutil.copy(image_path, dest_path)
-                logger.info(f"Copied image from {image_path} to {dest_path}")
+            if not _same_file(image_path, dest_path):
+                _link_or_copy(image_path, dest_path)
+                logger.info(f"Linked or copied image from {image_path} to {dest_path}")
             else:
                 logger.info(f"Skipped copying: '{image_path}' and '{dest_path}' are the same file.")
             input_image = dest_path
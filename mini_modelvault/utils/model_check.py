@@ -1,26 +1,178 @@
 import subprocess
 import os
+import json
+import time
+import hashlib
+import concurrent.futures
+from typing import Optional
 
-REQUIRED_MODELS = [
-    os.getenv("MODEL_GENERAL", "llama3.2:3b"),
-    os.getenv("MODEL_CODING", "qwen2.5-coder:3b"),
-    os.getenv("MODEL_VISION", "llava-phi3:latest"),
-]
+def required_models() -> list:
+    """
+    Resolve the required model names from the current environment.
 
-def check_and_pull_models():
+    Returns:
+        list: Model names for the general, coding and vision roles.
+    """
+    return [
+        os.getenv("MODEL_GENERAL", "llama3.2:3b"),
+        os.getenv("MODEL_CODING", "qwen2.5-coder:3b"),
+        os.getenv("MODEL_VISION", "llava-phi3:latest"),
+    ]
+
+MODELS_MARKER_PATH = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "mini_modelvault", "models_ok.json"
+)
+MODELS_MARKER_TTL = 3600  # seconds
+
+def _models_key(models: list) -> str:
+    """
+    Hash the required model set so the marker is invalidated when MODEL_* settings change.
+
+    Args:
+        models (list): Required model names.
+
+    Returns:
+        str: Hex digest identifying the current model set.
+    """
+    return hashlib.blake2b(repr(sorted(models)).encode(), digest_size=16).hexdigest()
+
+def _marker_fresh(key: str, ttl: float) -> bool:
+    """
+    Check whether the on-disk marker records a recent successful check of the same model set.
+
+    Args:
+        key (str): Model set key from _models_key().
+        ttl (float): Marker lifetime in seconds.
+
+    Returns:
+        bool: True if the marker is valid.
+    """
+    try:
+        with open(MODELS_MARKER_PATH, "r", encoding="utf-8") as f:
+            marker = json.load(f)
+        return marker.get("key") == key and time.time() - marker.get("ts", 0) < ttl
+    except (OSError, ValueError):
+        return False
+
+def _write_marker(key: str):
+    """
+    Record that the model set identified by key was verified just now.
+
+    Args:
+        key (str): Model set key from _models_key().
+    """
+    try:
+        os.makedirs(os.path.dirname(MODELS_MARKER_PATH), exist_ok=True)
+        with open(MODELS_MARKER_PATH, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "ts": time.time()}, f)
+    except OSError:
+        pass
+
+def list_installed_models() -> Optional[list]:
+    """
+    List models installed in Ollama. Prints nothing, so it is safe to run in the background.
+
+    Returns:
+        Optional[list]: Installed model names, or None if Ollama could not be queried.
+    """
     try:
         result = subprocess.run(["ollama", "list"], capture_output=True, text=True, check=True)
-        installed_models = [line.split()[0] for line in result.stdout.strip().split('\n')[1:] if line]
-    except Exception as e:
+    except Exception:
+        return None
+    return [line.split()[0] for line in result.stdout.strip().split('\n')[1:] if line]
+
+def find_missing_models(ttl: float = MODELS_MARKER_TTL) -> Optional[list]:
+    """
+    Silently determine which required models still need pulling.
+    Skips the Ollama query when a recent marker covers the same model set, and refreshes
+    the marker when nothing is missing.
+
+    Args:
+        ttl (float): Marker lifetime in seconds.
+
+    Returns:
+        Optional[list]: Missing model names, or None if Ollama could not be queried.
+    """
+    models = required_models()
+    key = _models_key(models)
+    if _marker_fresh(key, ttl):
+        return []
+    installed = list_installed_models()
+    if installed is None:
+        return None
+    missing = [model for model in dict.fromkeys(models) if model not in installed]
+    if not missing:
+        _write_marker(key)
+    return missing
+
+def pull_missing_models(missing: Optional[list]) -> bool:
+    """
+    Report the result of find_missing_models() and pull any missing models.
+
+    Args:
+        missing (Optional[list]): Result of find_missing_models().
+
+    Returns:
+        bool: True if all required models are installed.
+    """
+    if missing is None:
         print("[model_check] Could not check Ollama models. Is Ollama running and in your PATH?")
-        return
-
-    for model in REQUIRED_MODELS:
-        if model not in installed_models:
-            print(f"[model_check] Model '{model}' not found. Pulling with Ollama...")
-            try:
-                subprocess.run(["ollama", "pull", model], check=True)
-            except Exception as e:
-                print(f"[model_check] Failed to pull model '{model}': {e}")
-        else:
-            print(f"[model_check] Model '{model}' is already installed.") 
\ No newline at end of file
+        return False
+    if not missing:
+        return True
+    for model in missing:
+        print(f"[model_check] Model '{model}' not found. Pulling with Ollama...")
+    ok = _pull_models(missing)
+    if ok:
+        _write_marker(_models_key(required_models()))
+    return ok
+
+def check_and_pull_models_cached(ttl: float = MODELS_MARKER_TTL) -> bool:
+    """
+    Check for and pull missing models unless a recent on-disk marker shows the same models were verified.
+
+    Args:
+        ttl (float): Marker lifetime in seconds.
+
+    Returns:
+        bool: True if all required models are known to be installed.
+    """
+    return pull_missing_models(find_missing_models(ttl))
+
+def check_and_pull_models() -> bool:
+    """
+    Check every required model against Ollama, ignoring the on-disk marker, and pull the missing ones.
+
+    Returns:
+        bool: True if all required models are installed.
+    """
+    return pull_missing_models(find_missing_models(ttl=0))
+
+def _pull_models(to_pull: list) -> bool:
+    """
+    Pull models with Ollama concurrently.
+
+    Args:
+        to_pull (list): Model names to pull.
+
+    Returns:
+        bool: True if every pull succeeded.
+    """
+    # Pulls are network-bound and independent, so run them concurrently. With several pulls
+    # at once their progress bars would interleave, so only a single pull shows live progress.
+    quiet = len(to_pull) > 1
+
+    def pull(model: str) -> bool:
+        try:
+            subprocess.run(["ollama", "pull", model], check=True,
+                           stdout=subprocess.DEVNULL if quiet else None,
+                           stderr=subprocess.DEVNULL if quiet else None)
+            if quiet:
+                print(f"[model_check] Model '{model}' pulled.")
+            return True
+        except Exception as e:
+            print(f"[model_check] Failed to pull model '{model}': {e}")
+            return False
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(to_pull)) as executor:
+        return all(list(executor.map(pull, to_pull)))
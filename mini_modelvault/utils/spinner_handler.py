@@ -2,10 +2,15 @@
 spinner_handler.py – Utility for displaying a spinner during long-running CLI operations.
 Implements SpinnerHandler context manager for streaming output with logging.
 """
+import sys
+import threading
 from yaspin import yaspin
 from yaspin.spinners import Spinners
 from loguru import logger as default_logger
 
+FLUSH_CHARS = 8192  # flush buffered output once it reaches this many characters
+FLUSH_INTERVAL = 0.025  # or this many seconds after the first buffered character
+
 class SpinnerHandler:
     """
     Context manager for displaying a spinner and streaming output in the CLI.
@@ -25,6 +30,13 @@ class SpinnerHandler:
         self.spinner = yaspin(Spinners.line, text=text)
         self.first_chunk = True
         self.logger = logger or default_logger
+        self._debug = self.logger.opt(lazy=True).debug
+        self._buf = []
+        self._buf_len = 0
+        self._lock = threading.Lock()  # the flusher thread writes buffered output too
+        self._pending = threading.Event()  # set while the buffer holds unflushed output
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="spinner-flush", daemon=True)
 
     def __enter__(self):
         """
@@ -34,12 +46,25 @@ class SpinnerHandler:
             SpinnerHandler: The context manager instance.
         """
         self.spinner.start()
+        self._flusher.start()
         self.logger.debug("Spinner started.")
         return self
 
+    def _flush_loop(self):
+        """
+        Flush buffered output FLUSH_INTERVAL seconds after it arrives, until the context exits.
+        """
+        while True:
+            self._pending.wait()
+            if self._closed.wait(FLUSH_INTERVAL):
+                return
+            self.flush()
+
     def write_chunk(self, chunk):
         """
         Write a chunk of output, stopping the spinner on the first chunk.
+        Output is buffered and flushed on newlines, on FLUSH_CHARS characters, or by the
+        flusher thread FLUSH_INTERVAL seconds after the buffer became non-empty.
 
         Args:
             chunk: Output chunk to write.
@@ -49,8 +74,33 @@ class SpinnerHandler:
             print("🤖 ", end="", flush=True)
             self.first_chunk = False
             self.logger.debug("First chunk written, spinner stopped.")
-        print(chunk, end="", flush=True)
-        self.logger.debug(f"Chunk output: {chunk}")
+        text = str(chunk)
+        with self._lock:
+            if not self._buf:
+                self._pending.set()
+            self._buf.append(text)
+            self._buf_len += len(text)
+            if self._buf_len >= FLUSH_CHARS or "\n" in text:
+                self._write_buffer()
+        self._debug("Chunk output: {}", lambda: chunk)
+
+    def _write_buffer(self):
+        """
+        Write buffered output to stdout. The caller holds self._lock.
+        """
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            sys.stdout.flush()
+            self._buf.clear()
+            self._buf_len = 0
+        self._pending.clear()
+
+    def flush(self):
+        """
+        Write any buffered output to stdout.
+        """
+        with self._lock:
+            self._write_buffer()
 
     def __exit__(self, exc_type, exc_value, traceback):
         """
@@ -61,6 +111,10 @@ class SpinnerHandler:
             exc_value: Exception value.
             traceback: Exception traceback.
         """
+        self._closed.set()
+        self._pending.set()  # wake the flusher if it is idle so it can see _closed
+        self._flusher.join()
+        self.flush()
         if exc_type:
             self.spinner.fail("💥")
             self.logger.error(f"Spinner failed due to exception: {exc_value}", exc_info=True)